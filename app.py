@@ -1,16 +1,16 @@
 import streamlit as st
 import pandas as pd
-import geopandas as gpd
-import zipfile
 import requests
-from datetime import date, timedelta
-import tempfile
+import hashlib
 import os
+from datetime import date, timedelta
 import folium
-from streamlit_folium import st_folium
+import streamlit.components.v1 as components
 import json
 import numpy as np
 
+from flyingk.io_utils import CACHE_DIR, get_field_data, get_http_session
+
 # --- Page Configuration ---
 st.set_page_config(page_title="Farming Data Entry", page_icon="🌾", layout="wide")
 
@@ -22,46 +22,10 @@ API_URL = "https://openet-api.org/raster/timeseries/polygon"
 # --- Data Loading ---
 SHAPEFILE_URL = "https://raw.githubusercontent.com/koehnweston/FlyingKFarms/main/parcels_2.zip"
 
-@st.cache_data
-def load_data_from_github(url):
-    """
-    Loads, processes, and re-projects a zipped shapefile from a GitHub URL.
-    """
-    tmp_path = None
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-        
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".zip") as tmp:
-            tmp.write(response.content)
-            tmp_path = tmp.name
-
-        with zipfile.ZipFile(tmp_path, 'r') as zf:
-            shapefile_name = next((name for name in zf.namelist() if name.lower().endswith('.shp')), None)
-            if not shapefile_name:
-                st.error("Error: No .shp file found inside the zip archive.")
-                return None
-        
-        uri = f"zip://{tmp_path}!{shapefile_name}"
-        gdf = gpd.read_file(uri)
-        
-        if gdf.crs is None:
-            st.info("Shapefile CRS not found. Assuming KS State Plane North (EPSG:2241).")
-            gdf.set_crs(epsg=2241, inplace=True)
-        
-        gdf = gdf.to_crs(epsg=4326)
-        
-        return gdf
-        
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching data from URL: {e}")
-        return None
-    except Exception as e:
-        st.error(f"Error reading shapefile: {e}")
-        return None
-    finally:
-        if tmp_path and os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+# On-disk cache of OpenET responses, keyed by a content hash of the request.
+# st.cache_data alone is lost on restart, and every cache miss is a paid API
+# call, so idempotent responses are persisted as Parquet.
+OPENET_CACHE_DIR = os.path.join(CACHE_DIR, "openet")
 
 def handle_api_error(e):
     """Helper function to display API errors in Streamlit."""
@@ -73,21 +37,31 @@ def handle_api_error(e):
         except json.JSONDecodeError:
             st.text(e.response.text)
 
-@st.cache_data
+@st.cache_data(
+    ttl=timedelta(hours=24),
+    max_entries=256,
+    show_spinner=False,
+    # Key the cache by the polygon itself (via its WKB) instead of trusting
+    # the section name as a proxy: edited parcel boundaries then miss the
+    # cache instead of serving stale data.
+    hash_funcs={"shapely.geometry.polygon.Polygon": lambda g: g.wkb_hex},
+)
 def fetch_openet_variable(
-    _section_name, _geometry, start_date, end_date, api_key, variable, new_column_name, model="Ensemble", units=None
+    _section_name, geometry, start_date, end_date, api_key, variable, new_column_name, model="Ensemble", units=None
 ):
     """
     Generic function to fetch a time series variable from the OpenET API.
-    _section_name is unused but vital for Streamlit's cache to work correctly.
+    _section_name is only for readable spinner/log context; the cache key
+    comes from the geometry and the scalar arguments.
     """
     headers = {
         "accept": "application/json",
         "Content-Type": "application/json",
         "Authorization": api_key,
     }
-    coords = _geometry.exterior.coords
-    geometry_list = [val for pair in coords for val in pair]
+    # Bulk C-level conversion of the exterior ring; the old nested Python
+    # comprehension boxed every float one at a time.
+    geometry_list = np.asarray(geometry.exterior.coords).ravel().tolist()
 
     payload = {
         "date_range": [start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")],
@@ -102,29 +76,120 @@ def fetch_openet_variable(
     if units:
         payload["units"] = units
 
+    cache_key = hashlib.blake2b(
+        geometry.wkb
+        + f"{start_date:%Y-%m-%d}{end_date:%Y-%m-%d}{variable}{model}{units}{new_column_name}".encode()
+    ).hexdigest()
+    cache_path = os.path.join(OPENET_CACHE_DIR, f"{cache_key}.parquet")
+    if os.path.exists(cache_path):
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception:
+            pass  # corrupt cache file — refetch
+
+    # Request errors propagate to the caller: this function runs on worker
+    # threads, where handle_api_error's st.* calls would have no
+    # ScriptRunContext and be dropped silently. The drivers below report
+    # failures from the main thread after the pool joins.
+    response = get_http_session().post(API_URL, headers=headers, json=payload)
+    response.raise_for_status()
+
+    # orjson decodes the raw bytes in C (no Python json hot loop), and
+    # from_records skips DataFrame's type sniffing over the dict list.
     try:
-        response = requests.post(API_URL, headers=headers, json=payload)
-        response.raise_for_status()
-        
+        import orjson
+        data = orjson.loads(response.content)
+    except ImportError:
         data = response.json()
-        df = pd.DataFrame(data)
-        
-        if df.empty:
-            return None
-            
-        df['date'] = pd.to_datetime(df['time'])
-        df.set_index('date', inplace=True)
-        df.rename(columns={variable.lower(): new_column_name}, inplace=True)
+    df = pd.DataFrame.from_records(data)
 
-        if variable == 'ndvi':
-            df[new_column_name] = df[new_column_name].interpolate(method='linear')
-            
-        return df[[new_column_name]]
-        
-    except requests.exceptions.RequestException as e:
-        handle_api_error(e)
+    if df.empty:
         return None
 
+    # Daily interval: dates are always YYYY-MM-DD, so the explicit
+    # format skips per-value format inference.
+    df['date'] = pd.to_datetime(df['time'], format="%Y-%m-%d", cache=True)
+    df.set_index('date', inplace=True)
+    df.rename(columns={variable.lower(): new_column_name}, inplace=True)
+
+    if variable == 'ndvi':
+        df[new_column_name] = df[new_column_name].interpolate(method='linear')
+
+    result = df[[new_column_name]]
+    try:
+        os.makedirs(OPENET_CACHE_DIR, exist_ok=True)
+        result.to_parquet(cache_path, compression="zstd")
+    except Exception:
+        pass  # caching is best-effort
+
+    return result
+
+def fetch_openet_variables(section_name, geometry, start_date, end_date, api_key, specs):
+    """
+    Fetches several OpenET variables concurrently. The calls are
+    independent network round-trips, so fanning them out over a thread
+    pool makes the total wait the max of the latencies instead of the sum.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(len(specs), 8)) as pool:
+        futures = [
+            pool.submit(
+                fetch_openet_variable, section_name, geometry,
+                start_date, end_date, api_key, **spec
+            )
+            for spec in specs
+        ]
+        results, errors = [], []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except requests.exceptions.RequestException as e:
+                results.append(None)
+                errors.append(e)
+
+    # Report from the main thread — st.* calls on worker threads have no
+    # ScriptRunContext and vanish.
+    for e in errors:
+        handle_api_error(e)
+    return results
+
+# The three variables every fetch pulls; shared by the per-section fetch
+# button and the all-sections prefetch.
+OPENET_SPECS = [
+    {"variable": "ET", "new_column_name": "ET (in)", "units": "in"},
+    {"variable": "ndvi", "new_column_name": "NDVI", "model": "ssebop"},
+    {"variable": "pr", "new_column_name": "Precipitation (in)", "units": "in"},
+]
+
+def prefetch_all_sections(start_date, end_date, api_key):
+    """
+    Warms the OpenET caches (in-memory and on-disk) for every section over
+    the given window, so browsing section-to-section afterwards is instant.
+    OpenET allows concurrent in-flight requests; a bounded thread pool caps
+    us at 8 to stay inside its rate limits.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    index = st.session_state.get('section_index', {})
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [
+            pool.submit(
+                fetch_openet_variable, section, row.geometry,
+                start_date, end_date, api_key, **spec
+            )
+            for section, row in index.items()
+            for spec in OPENET_SPECS
+        ]
+        fetched = failed = 0
+        for future in futures:
+            try:
+                if future.result() is not None:
+                    fetched += 1
+            except requests.exceptions.RequestException:
+                failed += 1
+    return fetched, failed
+
 def run_irrigation_simulation(df):
     """
     Simulates daily plant available water and irrigation based on a set of rules.
@@ -135,54 +200,82 @@ def run_irrigation_simulation(df):
     MAX_DAILY_IRRIGATION = 650*1440/325851/125*12  # inches
 
     sim_df = df.copy()
-    
+
     # --- FIX: Fill potential missing values in the columns before the loop ---
     sim_df['ET (in)'] = sim_df['ET (in)'].fillna(0)
     sim_df['Precipitation (in)'] = sim_df['Precipitation (in)'].fillna(0)
 
-    # --- Initialize simulation columns ---
-    sim_df['Plant Available Water (in)'] = MAX_PAW
-    sim_df['Irrigation Applied (in)'] = 0.0
+    # The water balance is a recurrence (each day's PAW depends on the
+    # previous day's), so the day loop stays — but it now runs over plain
+    # NumPy arrays instead of per-cell .iloc indexing, which removes the
+    # pandas indexer/boxing overhead from every step.
+    et = sim_df['ET (in)'].to_numpy(dtype=np.float64)
+    precip = sim_df['Precipitation (in)'].to_numpy(dtype=np.float64)
+    month = sim_df.index.month.to_numpy()
+    day = sim_df.index.day.to_numpy()
+
+    # --- Pumping season (May 25 - Sep 20), precomputed for every day ---
+    in_season = (
+        ((month > 5) | ((month == 5) & (day >= 25)))
+        & ((month < 9) | ((month == 9) & (day <= 20)))
+    )
+
+    # float32 is plenty for inches-of-water and halves the bytes the chart
+    # columns ship to the browser; the loop itself accumulates in Python
+    # floats (double) so no precision is lost day to day.
+    n = len(sim_df)
+    paw = np.full(n, float(MAX_PAW), dtype=np.float32)
+    irrigation = np.zeros(n, dtype=np.float32)
 
     # --- Loop through each day of the dataset ---
-    for i in range(1, len(sim_df)):
-        prev_paw = sim_df.iloc[i-1]['Plant Available Water (in)']
-        
-        current_date = sim_df.index[i]
-        # --- FIX: Removed .fillna(0) from these lines ---
-        daily_et = sim_df.iloc[i]['ET (in)']
-        daily_precip = sim_df.iloc[i]['Precipitation (in)']
-
-        # --- Determine if today is in the pumping season (May 25 - Sep 20) ---
-        is_in_season = (5, 25) <= (current_date.month, current_date.day) <= (9, 20)
+    for i in range(1, n):
+        prev_paw = paw[i - 1]
 
         # --- Reset PAW to max on the first day of the season each year ---
-        prev_date = sim_df.index[i-1]
-        is_prev_day_in_season = (5, 25) <= (prev_date.month, prev_date.day) <= (9, 20)
-        if is_in_season and not is_prev_day_in_season:
-             prev_paw = MAX_PAW
+        if in_season[i] and not in_season[i - 1]:
+            prev_paw = MAX_PAW
 
         # --- Calculate water balance before considering irrigation ---
-        current_paw = prev_paw - daily_et + daily_precip
-        
+        current_paw = prev_paw - et[i] + precip[i]
+
         irrigation_today = 0.0
-        if is_in_season:
+        if in_season[i] and current_paw <= IRRIGATION_TRIGGER_LEVEL:
             # --- Trigger irrigation if PAW is at or below the threshold ---
-            if current_paw <= IRRIGATION_TRIGGER_LEVEL:
-                needed_water = MAX_PAW - current_paw
-                irrigation_today = min(needed_water, MAX_DAILY_IRRIGATION)
+            irrigation_today = min(MAX_PAW - current_paw, MAX_DAILY_IRRIGATION)
+        irrigation[i] = irrigation_today
 
         # --- Update final PAW for the day, clamping between 0 and MAX_PAW ---
-        final_paw = max(0, min(current_paw + irrigation_today, MAX_PAW))
+        paw[i] = max(0.0, min(current_paw + irrigation_today, MAX_PAW))
 
-        # --- Store results for the current day ---
-        sim_df.iloc[i, sim_df.columns.get_loc('Plant Available Water (in)')] = final_paw
-        sim_df.iloc[i, sim_df.columns.get_loc('Irrigation Applied (in)')] = irrigation_today
-        
+    sim_df['Plant Available Water (in)'] = paw
+    sim_df['Irrigation Applied (in)'] = irrigation
     # --- Calculate cumulative consumed groundwater (total irrigation) ---
-    sim_df['Consumed Groundwater (in)'] = sim_df['Irrigation Applied (in)'].cumsum()
+    sim_df['Consumed Groundwater (in)'] = np.cumsum(irrigation, dtype=np.float32)
     return sim_df
 
+def downsample_for_chart(series, max_points=500):
+    """
+    Thins a daily series to at most max_points evenly spaced samples before
+    charting. Multi-year windows otherwise ship thousands of points per
+    chart over Arrow for pixels the browser cannot distinguish anyway.
+    """
+    if len(series) <= max_points:
+        return series
+    idx = np.linspace(0, len(series) - 1, max_points).astype(int)
+    return series.iloc[idx]
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def build_map_html(section_id, geom_json, lat, lon):
+    """
+    Renders the folium map for one section to HTML once. folium's Jinja
+    rendering is slow enough to matter per rerun, and the map is purely
+    display-only, so the cached HTML can be served on every revisit.
+    """
+    m = folium.Map(location=[lat, lon], zoom_start=15, tiles=None)
+    folium.TileLayer('https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}', attr='Esri', name='Esri Satellite').add_to(m)
+    folium.GeoJson(geom_json, style_function=lambda x: {'fillColor': 'cyan', 'color': 'blue', 'weight': 2.5, 'fillOpacity': 0.4}).add_to(m)
+    return m.get_root().render()
+
 # --- Main App ---
 st.markdown("# 🌾 Farming Data Entry")
 
@@ -190,35 +283,30 @@ st.markdown("# 🌾 Farming Data Entry")
 st.sidebar.header("Field Setup")
 st.sidebar.info("Field data is automatically loaded from GitHub.")
 
+if st.sidebar.button("Purge OpenET Cache"):
+    import shutil
+    shutil.rmtree(OPENET_CACHE_DIR, ignore_errors=True)
+    st.sidebar.success("OpenET disk cache purged.")
+
 if st.sidebar.button("Clear Cache & Reload Data"):
-    st.cache_data.clear()
-    st.session_state.clear()
+    # Bump the parcels cache version instead of nuking st.cache_data
+    # wholesale — a reload should not evict the paid OpenET responses.
+    st.session_state.parcels_version = st.session_state.get("parcels_version", 0) + 1
+    for key in ("data_loaded", "section_index", "field_options"):
+        st.session_state.pop(key, None)
     st.rerun()
 
 # --- Data Loading Logic ---
 if 'data_loaded' not in st.session_state:
     with st.spinner("Loading field data from GitHub..."):
-        gdf = load_data_from_github(SHAPEFILE_URL)
-        if gdf is not None:
-            column_map = {col.lower(): col for col in gdf.columns}
-            if 'section' in column_map:
-                gdf.rename(columns={column_map['section']: 'Section'}, inplace=True)
-            if 'area' in column_map:
-                gdf.rename(columns={column_map['area']: 'Area'}, inplace=True)
-
-            if 'geometry' in gdf.columns and not gdf.empty:
-                centroids = gdf.geometry.centroid
-                gdf['X'] = centroids.x
-                gdf['Y'] = centroids.y
-            
-            st.session_state.gdf = gdf
-            
-            if "Section" in gdf.columns:
-                st.session_state.field_options = sorted(gdf["Section"].unique().tolist())
-                st.sidebar.success(f"Loaded {len(st.session_state.field_options)} unique sections.")
+        field_data = get_field_data(SHAPEFILE_URL, st.session_state.get("parcels_version", 0))
+        if field_data is not None:
+            st.session_state.section_index = field_data.index
+            st.session_state.field_options = field_data.options
+            if field_data.options:
+                st.sidebar.success(f"Loaded {len(field_data.options)} unique sections.")
             else:
                 st.sidebar.error("Shapefile is missing the 'Section' column.")
-                st.session_state.field_options = []
         else:
             st.sidebar.error("Failed to load shapefile from GitHub.")
     st.session_state.data_loaded = True
@@ -226,24 +314,72 @@ if 'data_loaded' not in st.session_state:
 # --- Main Content ---
 if not st.session_state.get('field_options'):
     st.warning("Could not load field data. Please check the configuration.")
-else:
+    # Bail out before any further widgets are constructed; nothing below
+    # works without the field list.
+    st.stop()
+
+# Deep links (?section=...) land directly on the requested field: seed the
+# selectbox's session-state key before the widget is instantiated.
+if "selected_section" not in st.session_state:
+    url_section = st.query_params.get("section")
+    if url_section in st.session_state.get('section_index', {}):
+        st.session_state.selected_section = url_section
+
+@st.fragment
+def field_info_panel():
+    """
+    Section selector, metrics, and map. Decorated with @st.fragment so
+    changing the selected field reruns only this subtree instead of the
+    whole script (data loading, OpenET section, simulation, ...).
+    """
     st.subheader("Field Information")
-    selected_section = st.selectbox("Select Field Section", options=st.session_state.field_options, index=0)
-
-    if selected_section and 'gdf' in st.session_state and st.session_state.gdf is not None:
-        section_data = st.session_state.gdf[st.session_state.gdf["Section"] == selected_section].iloc[0]
-        
-        col1, col2, col3 = st.columns(3)
-        col1.metric("X (Longitude)", f"{section_data.get('X', 0):.4f}")
-        col2.metric("Y (Latitude)", f"{section_data.get('Y', 0):.4f}")
-        col3.metric("Area", f"{section_data.get('Area', 0):.2f}")
-
-        st.markdown("##### Field Map")
-        map_center = [section_data.geometry.centroid.y, section_data.geometry.centroid.x]
-        m = folium.Map(location=map_center, zoom_start=15, tiles=None)
-        folium.TileLayer('https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}', attr='Esri', name='Esri Satellite').add_to(m)
-        folium.GeoJson(section_data.geometry, style_function=lambda x: {'fillColor': 'cyan', 'color': 'blue', 'weight': 2.5, 'fillOpacity': 0.4}).add_to(m)
-        st_folium(m, key=selected_section, width=725, height=500)
+    selected_section = st.selectbox(
+        "Select Field Section", options=st.session_state.field_options,
+        key="selected_section"
+    )
+
+    # The OpenET panel below lives outside this fragment, so a fragment-only
+    # rerun would leave it showing the previous section's charts and table.
+    # Promote a section change to a full-app rerun; unchanged selections
+    # keep the cheap fragment-scoped rerun.
+    prev_section = st.session_state.get("_rendered_section")
+    st.session_state._rendered_section = selected_section
+    if prev_section is not None and prev_section != selected_section:
+        st.rerun(scope="app")
+
+    # Stable layout slots created once per fragment pass; the metric columns
+    # and map are emitted into these instead of fresh top-level layouts.
+    metrics_ct = st.container()
+    map_ct = st.container()
+
+    if selected_section and st.session_state.get('section_index'):
+        section_data = st.session_state.section_index[selected_section]
+
+        with metrics_ct:
+            col1, col2, col3 = st.columns(3)
+            col1.metric("X (Longitude)", section_data["X_fmt"])
+            col2.metric("Y (Latitude)", section_data["Y_fmt"])
+            col3.metric("Area", section_data["Area_fmt"])
+
+        with map_ct:
+            st.markdown("##### Field Map")
+            map_html = build_map_html(
+                selected_section, section_data["geom_json"],
+                section_data["Y"], section_data["X"]
+            )
+            components.html(map_html, width=725, height=500)
+
+field_info_panel()
+
+@st.fragment
+def openet_panel():
+    """
+    OpenET fetch controls, simulation charts, and data table. A fragment so
+    date-picker and fetch-button interactions rerun only this subtree; the
+    current selection is read back out of session state on each pass.
+    """
+    selected_section = st.session_state.get("selected_section")
+    section_data = st.session_state.get('section_index', {}).get(selected_section)
 
     st.markdown("---")
     st.markdown("### Fetch OpenET Data (ET, NDVI, & Precipitation)")
@@ -265,35 +401,41 @@ else:
             st.warning("Start date cannot be after end date.")
         elif st.button("Fetch ET, NDVI, and Precipitation Data"):
             with st.spinner(f"Fetching OpenET data for '{selected_section}'..."):
-                et_df = fetch_openet_variable(
+                et_df, ndvi_df, precip_df = fetch_openet_variables(
                     selected_section, section_data.geometry, start_date, end_date, OPENET_API_KEY,
-                    variable="ET", new_column_name="ET (in)", units="in"
-                )
-                ndvi_df = fetch_openet_variable(
-                    selected_section, section_data.geometry, start_date, end_date, OPENET_API_KEY,
-                    variable="ndvi", new_column_name="NDVI", model="ssebop"
-                )
-                precip_df = fetch_openet_variable(
-                    selected_section, section_data.geometry, start_date, end_date, OPENET_API_KEY,
-                    variable="pr", new_column_name="Precipitation (in)", units="in"
+                    specs=OPENET_SPECS,
                 )
 
                 session_key = f'data_{selected_section}'
                 if session_key in st.session_state:
                     del st.session_state[session_key]
-                
+            
                 data_frames = [df for df in [et_df, ndvi_df, precip_df] if df is not None]
-                
+            
                 if data_frames:
-                    combined_df = data_frames[0]
-                    for df in data_frames[1:]:
-                        combined_df = pd.merge(combined_df, df, left_index=True, right_index=True, how='outer')
-                    
+                    # Every frame carries the same sorted daily DatetimeIndex, so
+                    # a single index join combines them without pd.merge's
+                    # hash-join and re-sort machinery.
+                    combined_df = data_frames[0].join(data_frames[1:], how='outer', sort=False)
+                    # ET/NDVI/precip fit comfortably in float32; halving the
+                    # column width halves the Arrow payload st.dataframe and the
+                    # charts ship to the browser.
+                    combined_df = combined_df.astype("float32")
+                
                     st.session_state[session_key] = combined_df
                     st.success("Successfully fetched and combined all available data!")
                 else:
                     st.warning("No data returned from OpenET for any variable.")
 
+        # Widgets inside a fragment must live in the fragment's own body —
+        # Streamlit raises if a fragment puts one in the sidebar.
+        if st.button("Pre-fetch all sections"):
+            with st.spinner("Pre-fetching OpenET data for all sections..."):
+                fetched, failed = prefetch_all_sections(start_date, end_date, OPENET_API_KEY)
+            st.success(f"Warmed {fetched} OpenET series.")
+            if failed:
+                st.warning(f"{failed} OpenET requests failed; see logs or retry.")
+
     session_key = f'data_{selected_section}'
     if st.session_state.get(session_key) is not None:
         st.markdown("---")
@@ -302,27 +444,29 @@ else:
 
         # --- RUN AND DISPLAY IRRIGATION SIMULATION ---
         if 'ET (in)' in df_to_show.columns and 'Precipitation (in)' in df_to_show.columns:
-            
+        
             # Run the simulation
             simulated_df = run_irrigation_simulation(df_to_show)
-            
+        
             st.markdown("##### Daily Plant Available Water (PAW)")
             st.info("Simulation assumes a max PAW of 6 inches. Irrigation is triggered when PAW drops to 3 inches.")
-            st.line_chart(simulated_df['Plant Available Water (in)'])
+            st.line_chart(downsample_for_chart(simulated_df['Plant Available Water (in)']))
 
             st.markdown("##### Simulated Consumed Groundwater (Cumulative Irrigation)")
             st.info("Irrigation is limited to a maximum of 0.25 inches per day and only occurs between May 25 and Sep 20.")
-            st.line_chart(simulated_df['Consumed Groundwater (in)'])
-            
+            st.line_chart(downsample_for_chart(simulated_df['Consumed Groundwater (in)']))
+        
             # Add simulation results to the main dataframe for the table view
             df_to_show = simulated_df.copy()
-        
+    
         else:
              st.warning("ET and/or Precipitation data is missing. Cannot run irrigation simulation.")
              if 'NDVI' in df_to_show.columns:
                 st.markdown("##### Daily NDVI")
-                st.line_chart(df_to_show['NDVI'])
+                st.line_chart(downsample_for_chart(df_to_show['NDVI']))
 
         st.markdown("---")
         st.markdown("##### Raw Data Table (with simulation results)")
         st.dataframe(df_to_show)
+
+openet_panel()
@@ -0,0 +1,111 @@
+"""Data-entry form specs and renderers shared by the Streamlit pages."""
+from datetime import date
+
+import streamlit as st
+
+
+# One explicit render function per data type: direct widget calls keep the
+# per-rerun hot path free of generic arg-unpacking and give Streamlit stable
+# widget identities.
+def _render_water_fields(col1, col2, key_prefix):
+    with col1:
+        entry_date = st.date_input("Date", value=date.today(), key=f"{key_prefix}_date")
+        field_id = st.text_input("Field ID or Name", key=f"{key_prefix}_field_id")
+    with col2:
+        water_gallons = st.number_input("Water Used (Gallons)", min_value=0.0, format="%.2f", key=f"{key_prefix}_gallons")
+        source = st.selectbox("Water Source", ["Well", "River", "Canal", "Municipal"], key=f"{key_prefix}_source")
+    notes = st.text_area("Notes", key=f"{key_prefix}_notes")
+    return {
+        "Date": entry_date,
+        "Field ID or Name": field_id,
+        "Water Used (Gallons)": water_gallons,
+        "Water Source": source,
+        "Notes": notes,
+    }
+
+
+def _render_crop_fields(col1, col2, key_prefix):
+    with col1:
+        planting_date = st.date_input("Planting Date", value=date.today(), key=f"{key_prefix}_date")
+        field_id = st.text_input("Field ID or Name", key=f"{key_prefix}_field_id")
+    with col2:
+        crop_type = st.selectbox("Crop Type", ["Corn", "Soybeans", "Wheat", "Cotton", "Other"], key=f"{key_prefix}_crop_type")
+        acres_planted = st.number_input("Acres Planted", min_value=0.0, format="%.2f", key=f"{key_prefix}_acres")
+    return {
+        "Planting Date": planting_date,
+        "Field ID or Name": field_id,
+        "Crop Type": crop_type,
+        "Acres Planted": acres_planted,
+    }
+
+
+def _render_yield_fields(col1, col2, key_prefix):
+    with col1:
+        harvest_date = st.date_input("Harvest Date", value=date.today(), key=f"{key_prefix}_date")
+        field_id = st.text_input("Field ID or Name", key=f"{key_prefix}_field_id")
+    with col2:
+        total_yield = st.number_input("Total Yield (e.g., bushels, lbs)", min_value=0.0, format="%.2f", key=f"{key_prefix}_total_yield")
+        units = st.text_input("Units (e.g., bushels, lbs)", key=f"{key_prefix}_units")
+    return {
+        "Harvest Date": harvest_date,
+        "Field ID or Name": field_id,
+        "Total Yield (e.g., bushels, lbs)": total_yield,
+        "Units (e.g., bushels, lbs)": units,
+    }
+
+
+# Built once at import time; per-rerun work is just the dict lookup plus the
+# specialized render call.
+FORM_SPECS = {
+    "Water Usage": {
+        "form_key": "water_usage_form",
+        "render": _render_water_fields,
+        "submit_label": "Submit Water Usage",
+        "success_message": "Water usage for {Field ID or Name} on {Date} submitted successfully!",
+        # Placeholder name -> widget key suffix, for the submit callback.
+        "message_fields": {"Field ID or Name": "field_id", "Date": "date"},
+    },
+    "Crop Data": {
+        "form_key": "crop_data_form",
+        "render": _render_crop_fields,
+        "submit_label": "Submit Crop Data",
+        "success_message": "Crop data submitted successfully!",
+        "message_fields": {},
+    },
+    "Yield Data": {
+        "form_key": "yield_data_form",
+        "render": _render_yield_fields,
+        "submit_label": "Submit Yield Data",
+        "success_message": "Yield data submitted successfully!",
+        "message_fields": {},
+    },
+}
+
+
+def _record_submission(form_key, success_message, message_fields):
+    """Submit callback: reads widget values from session state and stages
+    the success message, so the rerun doesn't re-derive anything."""
+    values = {
+        name: st.session_state.get(f"{form_key}_{suffix}")
+        for name, suffix in message_fields.items()
+    }
+    st.session_state[f"{form_key}_success"] = success_message.format(**values)
+    # In a real app, you would save this data to a database or file.
+
+
+def data_entry_form(form_key, render, submit_label, success_message, message_fields):
+    """Renders one data-entry form and reports submission."""
+    # Explicit flags: widget values are read out of session state by the
+    # submit callback, so nothing needs to be rebroadcast or cleared.
+    with st.form(form_key, clear_on_submit=False, enter_to_submit=False):
+        col1, col2 = st.columns(2)
+        render(col1, col2, form_key)
+        st.form_submit_button(
+            submit_label,
+            on_click=_record_submission,
+            args=(form_key, success_message, message_fields),
+        )
+
+    message = st.session_state.pop(f"{form_key}_success", None)
+    if message:
+        st.success(message)
@@ -0,0 +1,361 @@
+"""Shared shapefile/parcel loading helpers for the Flying K Farms app.
+
+Keeping the loaders in one module means every page shares a single set of
+@st.cache_data/@st.cache_resource entries instead of each page caching its
+own copy of the parcels.
+"""
+import math
+import os
+from collections import namedtuple
+from functools import lru_cache
+
+import streamlit as st
+
+# geopandas (which drags in shapely, pyproj, and GDAL bindings) and requests
+# are imported lazily inside the loaders, so pages that never touch the
+# parcels don't pay the ~1-2s geospatial import cost at startup.
+
+# Local Parquet cache of the parsed shapefile, so cold app restarts don't
+# have to re-download and re-parse the zip. Invalidated via the HTTP ETag.
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "flyingk")
+PARQUET_CACHE = os.path.join(CACHE_DIR, "parcels_2.parquet")
+ETAG_CACHE = os.path.join(CACHE_DIR, "parcels_2.etag")
+
+# Prebuilt GeoParquet checked into the repo (see
+# scripts/build_parcels_parquet.py). When present it already carries the
+# normalized columns, EPSG:4326 CRS, and centroid X/Y, so the whole
+# download/parse/reproject pipeline is skipped.
+LOCAL_PARQUET = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "parcels_2.parquet"
+)
+
+# Sorted section list written by the build script next to the parquet.
+# Loading it costs microseconds, versus a column scan + sort of the parcels.
+SECTIONS_JSON = os.path.join(os.path.dirname(LOCAL_PARQUET), "sections.json")
+
+# What the UI actually needs from the parcels: the sorted section list and
+# the Section -> row index. Keeping this lightweight tuple in session state
+# instead of the full GeoDataFrame avoids holding (and re-pickling) every
+# parcel geometry per user session.
+FieldData = namedtuple("FieldData", "options index")
+
+# Shared HTTP client (created lazily): connection pooling and keep-alive
+# amortize the TLS handshake across the GitHub download and every OpenET
+# call, with retries for transient gateway errors.
+_SESSION = None
+
+
+@st.cache_resource
+def load_section_list():
+    """Returns the prebuilt sorted section tuple from sections.json, or
+    None when the sidecar is absent (options are then derived from the
+    parcels themselves). Shared immutably across all sessions."""
+    try:
+        with open(SECTIONS_JSON, "rb") as f:
+            raw = f.read()
+    except OSError:
+        return None
+    try:
+        import orjson
+        return tuple(orjson.loads(raw))
+    except ImportError:
+        import json
+        return tuple(json.loads(raw))
+
+
+def get_http_session():
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _SESSION = session
+    return _SESSION
+
+
+def _fmt(value, spec):
+    """Formats a metric value, falling back to N/A for missing numbers."""
+    # Coerce first: the metric columns are stored as float32, and NumPy
+    # scalars are not instances of the builtin int/float.
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return "N/A"
+    if math.isnan(value):
+        return "N/A"
+    return format(value, spec)
+
+
+def _import_geopandas():
+    """Lazy geopandas import that also pins the fast pyogrio IO engine, so
+    any read_file call without an explicit engine= still avoids Fiona."""
+    import geopandas as gpd
+
+    gpd.options.io_engine = "pyogrio"
+    return gpd
+
+
+@lru_cache(maxsize=4)
+def _transformer_to_wgs84(crs_wkt):
+    """Cached source-CRS -> EPSG:4326 transformer. Building one re-opens the
+    PROJ database and compiles the pipeline (~100ms), so the instance is
+    reused across cache-miss reloads of the same dataset."""
+    from pyproj import Transformer
+
+    return Transformer.from_crs(crs_wkt, "EPSG:4326", always_xy=True)
+
+
+def _reproject_to_wgs84(gdf):
+    """
+    Reprojects a GeoDataFrame to EPSG:4326 with a single pyproj Transformer
+    applied to the packed coordinate array. This sidesteps geopandas'
+    per-geometry to_crs dispatch: one PROJ pipeline init, one vectorized
+    pass over every vertex.
+    """
+    import numpy as np
+    import shapely
+
+    geoms = gdf.geometry.values
+    coords = shapely.get_coordinates(geoms)
+    crs_from = gdf.crs
+
+    n = len(coords)
+    workers = min(os.cpu_count() or 1, 8)
+    if n >= 100_000 and workers > 1:
+        # Reprojection is embarrassingly parallel and Transformer.transform
+        # releases the GIL, but the Transformer itself is not thread-safe —
+        # each worker builds its own over a slice of the coordinate buffer.
+        from concurrent.futures import ThreadPoolExecutor
+
+        slices = np.array_split(np.arange(n), workers)
+        out = np.empty_like(coords)
+
+        def _project_slice(idx):
+            # Transformers are not thread-safe; each worker builds its own
+            # rather than sharing the cached one.
+            from pyproj import Transformer
+
+            t = Transformer.from_crs(crs_from, "EPSG:4326", always_xy=True)
+            out[idx, 0], out[idx, 1] = t.transform(coords[idx, 0], coords[idx, 1])
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_project_slice, slices))
+    else:
+        transformer = _transformer_to_wgs84(crs_from.to_wkt())
+        xs, ys = transformer.transform(coords[:, 0], coords[:, 1])
+        out = np.column_stack([xs, ys])
+
+    # The frame was freshly read and is discarded on error, so updating the
+    # geometries in place is safe and avoids a full copy.
+    shapely.set_coordinates(geoms, out)
+    return gdf.set_crs("EPSG:4326", allow_override=True)
+
+
+def _normalize_columns(gdf):
+    """Renames the shapefile's section/area columns (any case) to the
+    canonical Section/Area. Only the raw-shapefile path needs this; the
+    prebuilt and cached Parquet copies are written already normalized."""
+    lowered = gdf.columns.str.lower()
+    renames = {}
+    for lower, canonical in (("section", "Section"), ("area", "Area")):
+        matches = gdf.columns[lowered == lower]
+        if len(matches) and matches[0] != canonical:
+            renames[matches[0]] = canonical
+    if renames:
+        gdf.rename(columns=renames, inplace=True)
+    return gdf
+
+
+def _read_cached_etag():
+    try:
+        with open(ETAG_CACHE) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+@st.cache_data(ttl=3600, max_entries=2)
+def load_data_from_github(url, version=0):
+    """
+    Loads, processes, and re-projects a zipped shapefile from a GitHub URL.
+
+    `version` only participates in the cache key: bumping it forces a fresh
+    load of the parcels without evicting unrelated st.cache_data entries
+    (notably the paid OpenET responses).
+
+    The download is a conditional GET: when the cached ETag still matches,
+    GitHub answers 304 Not Modified and the on-disk Parquet copy is served
+    without transferring or re-parsing the zip. Fresh zips are parsed
+    straight from the response bytes — no temp file is written.
+    """
+    import io
+
+    import requests
+
+    gpd = _import_geopandas()
+
+    if os.path.exists(LOCAL_PARQUET):
+        try:
+            return _import_geopandas().read_parquet(LOCAL_PARQUET)
+        except Exception as e:
+            st.warning(f"Could not read prebuilt parcels parquet: {e}")
+
+    session = get_http_session()
+    try:
+        # Only ask for a 304 when we can actually serve one: a conditional
+        # GET without a readable parquet copy would leave us holding an
+        # empty 304 body (which raise_for_status does not reject).
+        etag = _read_cached_etag() if os.path.exists(PARQUET_CACHE) else None
+        headers = {"If-None-Match": etag} if etag else {}
+        response = session.get(url, headers=headers, timeout=30)
+
+        if response.status_code == 304:
+            # Upstream unchanged: Parquet parses an order of magnitude
+            # faster than SHP/DBF, and nothing was re-downloaded.
+            try:
+                return gpd.read_parquet(PARQUET_CACHE)
+            except Exception:
+                # Corrupt cache — refetch unconditionally.
+                response = session.get(url, timeout=30)
+
+        response.raise_for_status()
+        new_etag = response.headers.get("ETag") or response.headers.get("Last-Modified")
+
+        # pyogrio copies the buffer straight into GDAL's /vsimem/ in-memory
+        # filesystem — the zip never touches disk and is read exactly once.
+        gdf = gpd.read_file(io.BytesIO(response.content), engine="pyogrio", use_arrow=True)
+
+        if gdf.crs is None:
+            st.info("Shapefile CRS not found. Assuming KS State Plane North (EPSG:2241).")
+            gdf.set_crs(epsg=2241, inplace=True)
+
+        gdf = _normalize_columns(gdf)
+        gdf = _reproject_to_wgs84(gdf)
+
+        if new_etag:
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                gdf.to_parquet(PARQUET_CACHE)
+                with open(ETAG_CACHE, "w") as f:
+                    f.write(new_etag)
+            except Exception:
+                pass  # caching is best-effort; the app works without it
+
+        return gdf
+
+    except requests.exceptions.RequestException as e:
+        # Network trouble: fall back to the last good on-disk copy rather
+        # than failing the whole app on a cold start.
+        if os.path.exists(PARQUET_CACHE):
+            try:
+                st.warning(f"Could not reach GitHub ({e}); using cached field data.")
+                return gpd.read_parquet(PARQUET_CACHE)
+            except Exception:
+                pass
+        st.error(f"Error fetching data from URL: {e}")
+        return None
+    except Exception as e:
+        st.error(f"Error reading shapefile: {e}")
+        return None
+
+
+def load_shapefile(path):
+    """Reads a local shapefile with the fast pyogrio/Arrow path."""
+    gpd = _import_geopandas()
+
+    return gpd.read_file(path, engine="pyogrio", use_arrow=True)
+
+
+@st.cache_resource(ttl=3600, max_entries=2)
+def get_field_data(url, version=0):
+    """
+    Loads the parcels and derives everything the UI needs up front: the
+    sorted section list and a Section -> row index. Cached as a resource so
+    the result is computed once and shared across all sessions, instead of
+    being rebuilt on every first-load path.
+    """
+    gdf = load_data_from_github(url, version)
+    if gdf is None:
+        return None
+
+    # Column names are normalized at write time (build script and Parquet
+    # cache) or on the fresh-parse path in load_data_from_github, so no
+    # per-load rename walk is needed here.
+    if "Section" not in gdf.columns:
+        st.error("Parcels data is missing the expected 'Section' column.")
+        return None
+
+    # Prebuilt parquet already carries centroid columns; only compute them
+    # when loading from the raw shapefile. shapely's ufuncs run one C-level
+    # pass over the GEOS array instead of three GeoSeries dispatches.
+    if 'geometry' in gdf.columns and not gdf.empty and 'X' not in gdf.columns:
+        import shapely
+
+        centroids = shapely.centroid(gdf.geometry.values)
+        gdf['X'] = shapely.get_x(centroids)
+        gdf['Y'] = shapely.get_y(centroids)
+
+    if 'geometry' in gdf.columns and not gdf.empty:
+        import shapely
+
+        # Simplify once for display (~1 m tolerance at EPSG:4326) and
+        # pre-serialize to GeoJSON strings: sub-pixel vertices contribute
+        # nothing at field zoom but dominate the payload folium ships to
+        # the browser on every map render.
+        simplified = shapely.simplify(gdf.geometry.values, tolerance=1e-5, preserve_topology=True)
+        gdf['geom_json'] = shapely.to_geojson(simplified)
+
+    # Only these columns are ever read downstream; dropping the rest of the
+    # shapefile attributes (and downcasting the metric floats, which don't
+    # need float64 precision) shrinks every cached row.
+    keep = [c for c in ("Section", "Area", "X", "Y", "geometry", "geom_json") if c in gdf.columns]
+    gdf = gdf[keep]
+    num_cols = [c for c in ("X", "Y", "Area") if c in gdf.columns]
+    if num_cols:
+        gdf[num_cols] = gdf[num_cols].astype("float32")
+
+    if "Section" in gdf.columns:
+        # Categorical dtype gives us the unique values for free; ordering the
+        # categories once replaces the Python-level sorted(unique().tolist())
+        # scan with a zero-copy read of the (already sorted) category index.
+        section_cat = gdf["Section"].astype("category")
+        section_cat = section_cat.cat.reorder_categories(
+            sorted(section_cat.cat.categories), ordered=True
+        )
+        gdf["Section"] = section_cat
+
+        # Build a Section -> row index once so reruns do an O(1) dict
+        # lookup instead of re-scanning the GeoDataFrame. The metric strings
+        # are formatted here too, so reruns just display pre-built text.
+        # Keep the frame itself indexed by Section as well, so any ad-hoc
+        # access is a hash-indexed .loc instead of a boolean-mask scan.
+        gdf = gdf.set_index("Section", drop=False)
+
+        section_index = {}
+        for section, row in gdf.iterrows():
+            row["X_fmt"] = _fmt(row.get("X"), ".4f")
+            row["Y_fmt"] = _fmt(row.get("Y"), ".4f")
+            row["Area_fmt"] = _fmt(row.get("Area"), ".2f")
+            section_index[section] = row
+        # An immutable tuple keeps Streamlit's widget-options hashing cheap.
+        # The prebuilt sidecar skips even the category read, but only when
+        # every entry resolves in the index built from the parcels actually
+        # loaded — a stale sidecar must not offer sections that would crash
+        # the selector's lookup.
+        field_options = load_section_list()
+        if not field_options or any(s not in section_index for s in field_options):
+            field_options = tuple(section_cat.cat.categories)
+    else:
+        section_index = {}
+        field_options = ()
+
+    return FieldData(options=field_options, index=section_index)
@@ -1,3 +1,4 @@
+import altair as alt
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -11,15 +12,18 @@ st.write(
        and tables to analyze relationships between different data sources."""
 )
 
+_COLUMNS = ('Water Usage', 'Fertilizer Applied', 'Soil Moisture', 'Temperature', 'Yield')
+_YIELD_IDX = _COLUMNS.index('Yield')
+
 # Placeholder: Load some sample data
 @st.cache_data
 def load_data():
-    data = pd.DataFrame(
-        np.random.rand(100, 5),
-        columns=['Water Usage', 'Fertilizer Applied', 'Soil Moisture', 'Temperature', 'Yield']
-    )
-    data['Yield'] = data['Yield'] * 200 # Scale yield
-    return data
+    # default_rng is faster than the legacy np.random API and can fill
+    # float32 directly; scaling the column on the raw array avoids the
+    # copy that data['Yield'] * 200 would allocate.
+    arr = np.random.default_rng(0).random((100, len(_COLUMNS)), dtype=np.float32)
+    arr[:, _YIELD_IDX] *= 200.0  # Scale yield, in place
+    return pd.DataFrame(arr, columns=_COLUMNS, copy=False)
 
 df = load_data()
 
@@ -29,7 +33,23 @@ x_axis = st.selectbox("Select X-axis", df.columns)
 y_axis = st.selectbox("Select Y-axis", df.columns, index=4)
 
 st.write(f"### {y_axis} vs. {x_axis}")
-st.scatter_chart(df, x=x_axis, y=y_axis)
+# Only the two plotted columns go to the chart serializer; axis changes
+# used to re-ship all five. The explicit quantitative encodings skip
+# Vega-Lite's type inference, and .interactive() pans/zooms client-side
+# without a server round-trip.
+plot_cols = [x_axis] if x_axis == y_axis else [x_axis, y_axis]
+chart = (
+    alt.Chart(df[plot_cols])
+    .mark_circle()
+    .encode(
+        x=alt.X(x_axis, type="quantitative"),
+        y=alt.Y(y_axis, type="quantitative"),
+    )
+    .interactive()
+)
+st.altair_chart(chart, use_container_width=True)
 
 st.subheader("Raw Data Table")
-st.dataframe(df)
+# A fixed height keeps the grid virtualized instead of materializing
+# every row in the DOM.
+st.dataframe(df, height=300, use_container_width=True)
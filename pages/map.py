@@ -1,11 +1,26 @@
 import streamlit as st
-import geopandas as gpd
-import folium
-from streamlit_folium import st_folium
+import hashlib
+import io
+import math
 import tempfile
 import os
 import zipfile
 
+from flyingk.io_utils import CACHE_DIR, load_shapefile
+
+# Parsed uploads cached as GeoParquet, keyed by a hash of the zip bytes:
+# re-uploading the same file after a restart skips the whole
+# extract/parse/reproject/simplify pipeline for a milliseconds-level read.
+UPLOAD_CACHE_DIR = os.path.join(CACHE_DIR, "uploads")
+
+# The only zip members a shapefile read needs; anything else in the archive
+# (XML sidecars, backups, nested folders of exports) is skipped entirely.
+SHAPEFILE_EXTENSIONS = (".shp", ".shx", ".dbf", ".prj", ".cpg")
+
+# Above this many vertices, Leaflet's per-feature SVG rendering chokes;
+# such layers go to pydeck's WebGL GeoJsonLayer instead.
+LARGE_LAYER_VERTEX_THRESHOLD = 200_000
+
 st.set_page_config(page_title="Map View", page_icon="🗺️", layout="wide")
 
 st.markdown("# 🗺️ Map View")
@@ -15,6 +30,121 @@ st.write(
        The map will automatically center on your data."""
 )
 
+
+def _layer_bounds(gdf):
+    """(minx, miny, maxx, maxy) from one vectorized GEOS bounds call plus
+    NumPy reductions, instead of per-geometry Python iteration."""
+    import shapely
+
+    b = shapely.bounds(gdf.geometry.values)
+    return b[:, 0].min(), b[:, 1].min(), b[:, 2].max(), b[:, 3].max()
+
+
+def _to_geojson(gdf):
+    """
+    Serializes a GeoDataFrame to a FeatureCollection string using shapely's
+    vectorized GeoJSON writer for the geometries. folium's default path
+    walks __geo_interface__ vertex by vertex in Python; here the heavy part
+    happens in one C call and the properties are a small dict per feature.
+    """
+    import shapely
+
+    geom_strs = shapely.to_geojson(gdf.geometry.values)
+    props = gdf.drop(columns=gdf.geometry.name).to_dict("records")
+    try:
+        import orjson
+
+        def dumps(obj):
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    except ImportError:
+        import json
+
+        def dumps(obj):
+            return json.dumps(obj, default=float)
+
+    features = ",".join(
+        '{"type":"Feature","properties":%s,"geometry":%s}' % (dumps(p), g)
+        for p, g in zip(props, geom_strs)
+    )
+    return '{"type":"FeatureCollection","features":[%s]}' % features
+
+
+@st.cache_data(show_spinner="Loading shapefile...", max_entries=4)
+def load_uploaded_shapefile(zip_bytes):
+    """
+    Unzip -> read -> reproject -> simplify pipeline for an uploaded zipped
+    shapefile. Cached on the uploaded bytes, so every widget-driven rerun
+    with the same file reuses the parsed frame instead of re-running the
+    whole pipeline. Returns None when the archive has no .shp member.
+    """
+    digest = hashlib.blake2b(zip_bytes, digest_size=16).hexdigest()
+    cache_path = os.path.join(UPLOAD_CACHE_DIR, f"{digest}.parquet")
+    if os.path.exists(cache_path):
+        try:
+            import geopandas as gpd
+
+            return gpd.read_parquet(cache_path)
+        except Exception:
+            pass  # corrupt cache file — reparse the upload
+
+    # GDAL's /vsizip/ driver streams the shapefile straight out of the
+    # archive, so nothing is ever extracted — only the zip itself is
+    # materialized for GDAL to open, then deleted.
+    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zip_ref:
+        shp_name = next(
+            (name for name in zip_ref.namelist()
+             if os.path.basename(name) and name.lower().endswith(".shp")),
+            None,
+        )
+    if shp_name is None:
+        return None
+
+    tmp_zip = tempfile.NamedTemporaryFile(suffix=".zip", delete=False)
+    try:
+        tmp_zip.write(zip_bytes)
+        tmp_zip.close()
+        # Read the shapefile with the shared pyogrio/Arrow loader
+        gdf = load_shapefile(f"/vsizip/{tmp_zip.name}/{shp_name}")
+    finally:
+        os.unlink(tmp_zip.name)
+
+    # Reproject to WGS84 (EPSG:4326) if not already. Comparing with
+    # CRS.equals instead of to_epsg() matters for correctness: to_epsg()
+    # returns None for CRSes without an exact EPSG match, which made the
+    # old check silently skip reprojection and produce bogus bounds.
+    from pyproj import CRS
+
+    wgs84 = CRS.from_epsg(4326)
+    if gdf.crs is None:
+        st.warning("Shapefile has no CRS; assuming WGS84 (EPSG:4326).")
+        gdf = gdf.set_crs(wgs84)
+    elif not gdf.crs.equals(wgs84):
+        gdf = gdf.to_crs(wgs84)
+
+    # Simplify for display with a tolerance scaled to the layer's
+    # extent (~1/10000 of the diagonal): sub-pixel vertices bloat
+    # the GeoJSON folium ships to the browser and Leaflet's SVG
+    # work without changing a single rendered pixel.
+    bounds = _layer_bounds(gdf)
+    diag = math.hypot(bounds[2] - bounds[0], bounds[3] - bounds[1])
+    if diag > 0:
+        gdf["geometry"] = gdf.geometry.simplify(diag * 1e-4, preserve_topology=True)
+
+    # Snap coordinates to a ~0.1 m grid (1e-6 degrees): shapefiles carry
+    # float64 precision no browser can render, and shorter coordinate
+    # strings shrink the GeoJSON payload substantially.
+    import shapely
+
+    gdf["geometry"] = shapely.set_precision(gdf.geometry.values, grid_size=1e-6)
+
+    try:
+        os.makedirs(UPLOAD_CACHE_DIR, exist_ok=True)
+        gdf.to_parquet(cache_path, compression="zstd")
+    except Exception:
+        pass  # caching is best-effort
+
+    return gdf
+
 # --- Shapefile Uploader ---
 uploaded_file = st.file_uploader(
     "Choose a zipped shapefile",
@@ -23,43 +153,83 @@ uploaded_file = st.file_uploader(
 )
 
 # --- Map Display ---
-# Create a default map centered on the US
-m = folium.Map(location=[39.8283, -98.5795], zoom_start=4)
+@st.cache_resource
+def _default_map():
+    """US-centered base map for reruns with no upload, built once and shared.
+    prefer_canvas batches Leaflet drawing onto a canvas instead of one SVG
+    node per feature. Never mutated — uploads render on their own map."""
+    import folium
+
+    return folium.Map(location=[39.8283, -98.5795], zoom_start=4, prefer_canvas=True)
+
+
+m = _default_map()
+rendered_with_pydeck = False
 
 if uploaded_file is not None:
     try:
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Unzip the uploaded file
-            with zipfile.ZipFile(uploaded_file, 'r') as zip_ref:
-                zip_ref.extractall(temp_dir)
-
-            # Find the .shp file in the extracted contents
-            shp_file_path = None
-            for file in os.listdir(temp_dir):
-                if file.endswith(".shp"):
-                    shp_file_path = os.path.join(temp_dir, file)
-                    break
-
-            if shp_file_path:
-                # Read the shapefile with geopandas
-                gdf = gpd.read_file(shp_file_path)
-
-                # Reproject to WGS84 (EPSG:4326) if not already
-                if gdf.crs.to_epsg() != 4326:
-                    gdf = gdf.to_crs(epsg=4326)
-
-                # Add the GeoDataFrame to the map
-                folium.GeoJson(gdf, tooltip=folium.GeoJsonTooltip(fields=list(gdf.columns))).add_to(m)
-
-                # Get the bounds of the GeoDataFrame to center the map
-                bounds = gdf.total_bounds
-                m.fit_bounds([[bounds[1], bounds[0]], [bounds[3], bounds[2]]])
-                st.success("Shapefile loaded and displayed on the map!")
+        gdf = load_uploaded_shapefile(uploaded_file.getvalue())
+        if gdf is None:
+            st.error("No .shp file found in the uploaded zip archive.")
+        else:
+            bounds = _layer_bounds(gdf)
+            diag = math.hypot(bounds[2] - bounds[0], bounds[3] - bounds[1])
+
+            import shapely
+
+            n_vertices = len(shapely.get_coordinates(gdf.geometry.values))
+            if n_vertices > LARGE_LAYER_VERTEX_THRESHOLD:
+                # WebGL rasterizes in O(visible pixels) rather than
+                # O(vertices), so huge layers stay interactive. pydeck
+                # ships with Streamlit — no extra dependency.
+                import pydeck as pdk
+
+                zoom = max(1, min(15, int(math.log2(360 / diag)))) if diag > 0 else 4
+                st.pydeck_chart(pdk.Deck(
+                    layers=[pdk.Layer(
+                        "GeoJsonLayer",
+                        gdf.__geo_interface__,
+                        stroked=True,
+                        filled=True,
+                        get_fill_color=[0, 110, 220, 60],
+                        get_line_color=[0, 110, 220, 200],
+                        pickable=True,
+                    )],
+                    initial_view_state=pdk.ViewState(
+                        latitude=(bounds[1] + bounds[3]) / 2,
+                        longitude=(bounds[0] + bounds[2]) / 2,
+                        zoom=zoom,
+                    ),
+                    map_style=None,
+                ))
+                rendered_with_pydeck = True
             else:
-                st.error("No .shp file found in the uploaded zip archive.")
+                # Tooltip only the attribute columns — feeding the geometry
+                # column to GeoJsonTooltip stringifies every vertex into the
+                # payload (and newer folium rejects it outright).
+                import folium
+
+                tooltip_fields = [c for c in gdf.columns if c != gdf.geometry.name]
+                # Fresh map per upload: layers must not accumulate on the
+                # shared cached default.
+                m = folium.Map(location=[39.8283, -98.5795], zoom_start=4, prefer_canvas=True)
+                folium.GeoJson(
+                    _to_geojson(gdf),
+                    tooltip=folium.GeoJsonTooltip(fields=tooltip_fields) if tooltip_fields else None,
+                ).add_to(m)
+
+                # Center the map on the layer's bounds
+                m.fit_bounds([[bounds[1], bounds[0]], [bounds[3], bounds[2]]])
+            st.success("Shapefile loaded and displayed on the map!")
 
     except Exception as e:
         st.error(f"An error occurred while processing the file: {e}")
 
-# Display the map
-st_folium(m, width='100%', height=600)
+# Display the folium map (pydeck renders inline above for large layers).
+# The page is display-only, so returned_objects=[] stops st_folium from
+# echoing the full map state (bounds, zoom, clicks) back to Python and
+# triggering a rerun on every pan.
+if not rendered_with_pydeck:
+    from streamlit_folium import st_folium
+
+    st_folium(m, width='100%', height=600, returned_objects=[])
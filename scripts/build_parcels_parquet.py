@@ -0,0 +1,55 @@
+"""One-off build script: materialize the parcels shapefile as GeoParquet.
+
+Runs the whole boot-path pipeline ahead of time — read the zipped
+shapefile, normalize the Section/Area column names, reproject to
+EPSG:4326, and compute centroid X/Y columns — and writes the result as
+zstd-compressed GeoParquet. The app picks up a repo-local
+parcels_2.parquet automatically and skips the download/parse/reproject
+work entirely.
+
+A sections.json sidecar with the sorted section list is written next to
+the parquet, so the selector options can be loaded without touching the
+parcels at all.
+
+Usage:
+    python scripts/build_parcels_parquet.py [src.zip] [dst.parquet]
+"""
+import json
+import os
+import sys
+
+import geopandas as gpd
+
+
+def main(src="parcels_2.zip", dst="parcels_2.parquet"):
+    gdf = gpd.read_file(src, engine="pyogrio", use_arrow=True)
+
+    if gdf.crs is None:
+        # Same assumption the app makes: KS State Plane North.
+        gdf = gdf.set_crs(epsg=2241)
+
+    column_map = {col.lower(): col for col in gdf.columns}
+    if 'section' in column_map:
+        gdf = gdf.rename(columns={column_map['section']: 'Section'})
+    if 'area' in column_map:
+        gdf = gdf.rename(columns={column_map['area']: 'Area'})
+
+    gdf = gdf.to_crs(epsg=4326)
+
+    centroids = gdf.geometry.centroid
+    gdf['X'] = centroids.x
+    gdf['Y'] = centroids.y
+
+    gdf.to_parquet(dst, compression="zstd")
+    print(f"Wrote {len(gdf)} parcels to {dst}")
+
+    if 'Section' in gdf.columns:
+        sections = sorted(gdf['Section'].unique().tolist())
+        sidecar = os.path.join(os.path.dirname(os.path.abspath(dst)), "sections.json")
+        with open(sidecar, "w") as f:
+            json.dump(sections, f)
+        print(f"Wrote {len(sections)} sections to {sidecar}")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])